@@ -6,10 +6,53 @@ Simple workflow: select one half of a contour, mirror it to replace the other ha
 """
 
 from __future__ import division, print_function, unicode_literals
+from collections import namedtuple
+import importlib
 import objc
 from GlyphsApp import Glyphs, Message, GSOFFCURVE, GSLayer, GSPath
 from vanilla import Window, RadioGroup, Button, CheckBox
 
+import mirror_geometry
+importlib.reload(mirror_geometry)  # Glyphs caches modules across script runs
+from mirror_geometry import classify_selection, linearize_selection
+
+# Set to True to trace each mirror step in the Macro Panel.
+DEBUG = False
+
+
+def log(message, *args):
+    """Print a [Mirror] trace line; formatting is skipped entirely unless DEBUG is on."""
+    if DEBUG:
+        print("[Mirror] " + (message % args if args else message))
+
+
+# (axis, sourceSide) for each sideRadio index: 0 = Top, 1 = Right, 2 = Bottom, 3 = Left.
+# A 'vertical' axis is a left/right mirror, 'horizontal' a top/bottom mirror.
+_DIRECTIONS = (
+    ('horizontal', 'top'),
+    ('vertical', 'right'),
+    ('horizontal', 'bottom'),
+    ('vertical', 'left'),
+)
+
+# Which side of the seam the source half lies on, relative to the mirrored axis:
+# +1 keeps coordinates above the seam, -1 keeps those below it.
+_SIDE_SIGN = {'left': -1, 'right': 1, 'top': 1, 'bottom': -1}
+
+# One bridge read of a path: nodes plus parallel coordinate/type lists
+PathSnapshot = namedtuple(
+    "PathSnapshot", ["nodes", "xs", "ys", "is_off", "selected_indices"]
+)
+
+
+def _mirrorTransform(axis, seam_coord):
+    """Affine tuple mirroring across the seam; 'vertical' flips x, 'horizontal' flips y."""
+    if axis == 'vertical':
+        # Mirror horizontally: x' = -x + 2*seam
+        return (-1.0, 0.0, 0.0, 1.0, 2.0 * seam_coord, 0.0)
+    # Mirror vertically: y' = -y + 2*seam
+    return (1.0, 0.0, 0.0, -1.0, 0.0, 2.0 * seam_coord)
+
 
 class MirrorSelectionUI(object):
     def __init__(self):
@@ -54,19 +97,13 @@ class MirrorSelectionUI(object):
         index = self.w.sideRadio.get()
         autoSnap = bool(self.w.snapCheck.get())
         
-        # index: 0 = Top, 1 = Right, 2 = Bottom, 3 = Left
-        if index in (1, 3):
-            # horizontal mirror (vertical seam)
-            if index == 3:
-                self.mirror(axis='vertical', sourceSide='left', autoSnap=autoSnap)
-            else:
-                self.mirror(axis='vertical', sourceSide='right', autoSnap=autoSnap)
-        else:
-            # vertical mirror (horizontal seam)
-            if index == 0:
-                self.mirror(axis='horizontal', sourceSide='top', autoSnap=autoSnap)
-            else:
-                self.mirror(axis='horizontal', sourceSide='bottom', autoSnap=autoSnap)
+        axis, sourceSide = _DIRECTIONS[index]
+        # Coalesce the per-path node writes into a single interface update
+        self.font.disableUpdateInterface()
+        try:
+            self.mirror(axis=axis, sourceSide=sourceSide, autoSnap=autoSnap)
+        finally:
+            self.font.enableUpdateInterface()
         
         if self.font.currentTab:
             self.font.currentTab.redraw()
@@ -81,94 +118,110 @@ class MirrorSelectionUI(object):
         """
         layer = self.layer
         
-        # Find paths that have selected nodes
+        # Find paths that have selected nodes; the snapshot that answers this
+        # is handed on to mirrorPath so no path is walked twice.
         selected_paths = []
         for path in layer.paths:
-            if any(n.selected for n in path.nodes if n is not None):
-                selected_paths.append(path)
+            snapshot = self._snapshotPath(path)
+            if snapshot.selected_indices:
+                selected_paths.append((path, snapshot))
         
         if not selected_paths:
             Message("No nodes selected", "Select nodes on one half of a contour and try again.")
             return
         
-        print("[Mirror] Found %d paths with selected nodes" % len(selected_paths))
+        log("Found %d paths with selected nodes", len(selected_paths))
         
         # Process each selected path independently
-        for path in selected_paths:
-            self.mirrorPath(path, axis, sourceSide, autoSnap)
+        for path, snapshot in selected_paths:
+            self.mirrorPath(path, axis, sourceSide, autoSnap, snapshot)
+        
+        # Refresh the layer's metrics once for all rewritten paths
+        layer.updateMetrics()
+    
+    def _snapshotPath(self, path):
+        """
+        Read every node of a path across the bridge exactly once.
+        
+        Returns a PathSnapshot: parallel node data lists plus the indices of the
+        selected nodes, gathered in the same pass.
+        """
+        nodes, xs, ys, is_off, selected_indices = [], [], [], [], []
+        add_node = nodes.append
+        add_x = xs.append
+        add_y = ys.append
+        add_off = is_off.append
+        add_selected = selected_indices.append
+        offcurve = GSOFFCURVE
+        for n in path.nodes:
+            if n is None:
+                continue
+            pos = n.position
+            if n.selected:
+                add_selected(len(nodes))
+            add_node(n)
+            add_x(pos.x)
+            add_y(pos.y)
+            add_off(n.type == offcurve)
+        return PathSnapshot(nodes, xs, ys, is_off, selected_indices)
     
-    def mirrorPath(self, path, axis, sourceSide, autoSnap):
-        """Mirror a single path by replacing the opposite side with the selected side."""
+    def mirrorPath(self, path, axis, sourceSide, autoSnap, snapshot=None):
+        """
+        Mirror a single path by replacing the opposite side with the selected side.
+        
+        snapshot: optional result of _snapshotPath(path), if the caller already has it
+        """
         layer = self.layer
 
-        # Collect selected nodes in this path
-        selected_nodes = [n for n in path.nodes if n is not None and n.selected]
+        # Read node data from the bridge once; every classification pass
+        # below works on these plain Python lists instead of path.nodes.
+        if snapshot is None:
+            snapshot = self._snapshotPath(path)
+        nodes, xs, ys, is_off, selected_indices = snapshot
         
-        if not selected_nodes:
+        if not selected_indices:
             return
         
-        # Determine seam axis from selected nodes
+        # Bind the axis- and side-specific helpers once, so the per-node
+        # loops below don't dispatch on the axis/side strings every time.
         if axis == 'vertical':
-            # Vertical seam (left/right mirror)
-            if sourceSide == 'left':
-                seam_coord = max(n.position.x for n in selected_nodes)
-            else:  # right
-                seam_coord = min(n.position.x for n in selected_nodes)
+            coords = xs
             coord_attr = 'x'
+            get_coord = lambda n: n.position.x
+            def set_coord(n, v):
+                n.position.x = v
         else:
-            # Horizontal seam (top/bottom mirror)
-            if sourceSide == 'top':
-                seam_coord = min(n.position.y for n in selected_nodes)
-            else:  # bottom
-                seam_coord = max(n.position.y for n in selected_nodes)
+            coords = ys
             coord_attr = 'y'
+            get_coord = lambda n: n.position.y
+            def set_coord(n, v):
+                n.position.y = v
         
-        # Calculate the TRUE center from total path bounds
-        all_nodes = [n for n in path.nodes if n is not None]
-        if axis == 'vertical':
-            min_coord = min(n.position.x for n in all_nodes)
-            max_coord = max(n.position.x for n in all_nodes)
-        else:
-            min_coord = min(n.position.y for n in all_nodes)
-            max_coord = max(n.position.y for n in all_nodes)
-        bounds_center = (min_coord + max_coord) / 2.0
-        original_size = max_coord - min_coord
+        # +1 when the source half lies above the seam, -1 when below
+        sign = _SIDE_SIGN[sourceSide]
         
-        print("[Mirror] Total path bounds %s: [%.1f, %.1f], center: %.1f, size: %.1f" % 
-              (coord_attr, min_coord, max_coord, bounds_center, original_size))
-        print("[Mirror] Selection edge seam at %s=%.1f" % (coord_attr, seam_coord))
-        
-        # Check if selected nodes actually reach the TRUE center (bounds center)
-        # If not, use bounds center as the axis instead of selection edge
+        # Seam edge, bounds, center reach and side count in plain Python
         seam_band = 5.0
-        nodes_at_center = [n for n in selected_nodes 
-                          if n.type != GSOFFCURVE 
-                          and abs(getattr(n.position, coord_attr) - bounds_center) <= seam_band]
+        info = classify_selection(coords, is_off, selected_indices, sign,
+                                  center_band=seam_band)
+        seam_coord = info.seam
+        min_coord = info.min_coord
+        max_coord = info.max_coord
+        original_size = max_coord - min_coord
         
-        if not nodes_at_center:
+        log("Total path bounds %s: [%.1f, %.1f], center: %.1f, size: %.1f",
+            coord_attr, min_coord, max_coord, (min_coord + max_coord) / 2.0, original_size)
+        log("Selection edge seam at %s=%.1f", coord_attr, info.edge)
+        
+        if not info.center_count:
             # Selection doesn't reach center - use bounds center as axis
-            seam_coord = bounds_center
-            print("[Mirror] Selection doesn't reach center, using bounds center: %s=%.1f" % (coord_attr, seam_coord))
+            log("Selection doesn't reach center, using bounds center: %s=%.1f", coord_attr, seam_coord)
         else:
-            print("[Mirror] Found %d nodes at center, using seam-based axis" % len(nodes_at_center))
+            log("Found %d nodes at center, using seam-based axis", info.center_count)
 
         # Guard: ensure we actually have some nodes clearly on one side of the seam.
         # If the user only selected the seam nodes, do NOTHING instead of destroying the path.
-        side_nodes = []
-        for n in selected_nodes:
-            v = getattr(n.position, coord_attr)
-            if axis == 'vertical':
-                if sourceSide == 'left' and v < seam_coord - 0.01:
-                    side_nodes.append(n)
-                elif sourceSide == 'right' and v > seam_coord + 0.01:
-                    side_nodes.append(n)
-            else:
-                if sourceSide == 'top' and v > seam_coord + 0.01:
-                    side_nodes.append(n)
-                elif sourceSide == 'bottom' and v < seam_coord - 0.01:
-                    side_nodes.append(n)
-
-        if not side_nodes:
+        if not info.side_count:
             # Only seam (or nearly-seam) nodes selected – bail out safely.
             Message(
                 "Selection is only seam nodes",
@@ -179,109 +232,98 @@ class MirrorSelectionUI(object):
         
         # Snap seam nodes if requested
         if autoSnap:
-            seam_nodes = [n for n in selected_nodes 
-                         if n.type != GSOFFCURVE 
-                         and abs(getattr(n.position, coord_attr) - seam_coord) <= 5.0]
+            # Collect seam on-curves and their running total in one pass
+            seam_nodes = []
+            total = 0.0
+            for i in selected_indices:
+                if is_off[i]:
+                    continue
+                c = coords[i]
+                if abs(c - seam_coord) <= 5.0:
+                    seam_nodes.append(i)
+                    total += c
             
             if seam_nodes:
-                avg = sum(getattr(n.position, coord_attr) for n in seam_nodes) / len(seam_nodes)
-                for n in seam_nodes:
-                    setattr(n.position, coord_attr, avg)
+                avg = total / len(seam_nodes)
+                for i in seam_nodes:
+                    set_coord(nodes[i], avg)
+                    coords[i] = avg
                 seam_coord = avg
-                print("[Mirror] Snapped %d seam nodes to %.1f" % (len(seam_nodes), avg))
+                log("Snapped %d seam nodes to %.1f", len(seam_nodes), avg)
         
-        # Work on a copy of the path so we can replace the original cleanly
-        try:
-            pathIndex = list(layer.paths).index(path)
-        except ValueError:
-            # Path not found in layer; nothing to do
-            print("[Mirror] Warning: path not found in layer")
-            return
-
         # Work on a COPY of the path to avoid modifying the original during processing
         # We need to preserve the original connectivity logic.
         # If we delete nodes from a closed path, we might create a gap in the middle of the list.
         # We must reorder the nodes so the gap is at the end.
         
-        # 1. Identify selected indices
-        selected_indices = [i for i, n in enumerate(path.nodes) if n.selected]
+        # 1. Selected indices come from the snapshot taken above
         if len(selected_indices) < 2:
             return
 
-        # 2. Find the gap in the sequence
-        total_original = len(path.nodes)
-        gap_indices = []
-        
-        for k in range(len(selected_indices)):
-            curr_idx = selected_indices[k]
-            next_idx = selected_indices[(k + 1) % len(selected_indices)]
-            diff = (next_idx - curr_idx) % total_original
-            if diff != 1:
-                gap_indices.append(k)
-        
-        # 3. Determine best start point
-        if len(gap_indices) == 1:
-            gap_index = gap_indices[0]
-            start_pos = (gap_index + 1) % len(selected_indices)
-            new_order_indices = selected_indices[start_pos:] + selected_indices[:start_pos]
-        elif len(gap_indices) == 0:
-            new_order_indices = selected_indices
-        else:
-            # Multiple gaps? Just use the first gap found to linearize it.
-            gap_index = gap_indices[0]
-            start_pos = (gap_index + 1) % len(selected_indices)
-            new_order_indices = selected_indices[start_pos:] + selected_indices[:start_pos]
+        # 2. Rotate so the first gap in the selection sits at the end
+        new_order_indices = linearize_selection(selected_indices, len(nodes))
 
-        # 4. Build the working path with correctly ordered copies
+        # 3. Build the working path with correctly ordered copies in a single
+        #    nodes assignment instead of one proxy append per node
         working_path = GSPath()
-        for idx in new_order_indices:
-            working_path.nodes.append(path.nodes[idx].copy())
-            
+        working_path.nodes = [nodes[idx].copy() for idx in new_order_indices]
         working_path.closed = False
         
-        print("[Mirror] Reordered working path has %d nodes" % len(working_path.nodes))
+        # The mirrored half is the source half reflected node for node, so every
+        # count below comes from the source indices rather than the GSPaths.
+        half_count = len(new_order_indices)
+        log("Reordered working path has %d nodes", half_count)
         
         # Now mirror the remaining (source) side
         source_half = working_path
         mirrored_half = source_half.copy()
         
-        # Apply mirror transform
-        if axis == 'vertical':
-            # Mirror horizontally: x' = -x + 2*seam
-            mirrored_half.applyTransform((-1.0, 0.0, 0.0, 1.0, 2.0 * seam_coord, 0.0))
-        else:
-            # Mirror vertically: y' = -y + 2*seam
-            mirrored_half.applyTransform((1.0, 0.0, 0.0, -1.0, 0.0, 2.0 * seam_coord))
+        # Apply mirror transform (one native affine pass inside Glyphs)
+        mirrored_half.applyTransform(_mirrorTransform(axis, seam_coord))
 
         # Log initial metrics
-        print("[Mirror] Source half: %d nodes, closed=%s" % (len(source_half.nodes), source_half.closed))
-        print("[Mirror] Mirrored half: %d nodes, closed=%s" % (len(mirrored_half.nodes), mirrored_half.closed))
+        log("Source and mirrored halves: %d nodes each, closed=%s", half_count, source_half.closed)
         
         # Calculate expected final node count
-        selected_count = len(selected_nodes)
+        selected_count = len(selected_indices)
         
         # Count how many nodes in the source_half are on the seam (will be deduplicated)
-        seam_node_count = sum(1 for n in source_half.nodes 
-                             if abs(getattr(n.position, coord_attr) - seam_coord) <= 1.0)
+        # Nodes within seam_tolerance of the seam form the shared seam band,
+        # which the merge loop below tests with the same abs() comparison.
+        seam_tolerance = 1.0
+        seam_node_count = sum(1 for idx in new_order_indices
+                              if abs(coords[idx] - seam_coord) <= seam_tolerance)
         
         # Expected = source + mirrored - seam_duplicates
-        expected_count = len(source_half.nodes) + len(mirrored_half.nodes) - seam_node_count
+        expected_count = 2 * half_count - seam_node_count
         
-        print("[Mirror] Selected: %d, source half: %d, seam nodes to dedupe: %d, expected final: %d" % 
-              (selected_count, len(source_half.nodes), seam_node_count, expected_count))
+        log("Selected: %d, source half: %d, seam nodes to dedupe: %d, expected final: %d",
+            selected_count, half_count, seam_node_count, expected_count)
         
-        # Try removeOverlap first
-        tmp_layer = GSLayer()
-        tmp_layer.width = layer.width
-        tmp_layer.paths.append(source_half)
-        tmp_layer.paths.append(mirrored_half)
-        tmp_layer.removeOverlap()
+        # If no source node crosses the seam band, the two halves can only meet
+        # at the seam and there is nothing for removeOverlap to resolve: skip
+        # the scratch-layer boolean and join the halves directly.
+        one_sided = all((coords[idx] - seam_coord) * sign >= -seam_tolerance
+                        for idx in new_order_indices)
         
-        print("[Mirror] After removeOverlap: %d paths" % len(tmp_layer.paths))
+        if one_sided:
+            merged = None
+            log("Source half stays on one side of the seam, skipping removeOverlap")
+        else:
+            # Try removeOverlap first
+            tmp_layer = GSLayer()
+            tmp_layer.width = layer.width
+            tmp_layer.paths.append(source_half)
+            tmp_layer.paths.append(mirrored_half)
+            tmp_layer.removeOverlap()
+            
+            log("After removeOverlap: %d paths", len(tmp_layer.paths))
+            
+            # If removeOverlap didn't merge (still 2 paths), manually merge them
+            merged = tmp_layer.paths[0] if len(tmp_layer.paths) < 2 else None
         
-        # If removeOverlap didn't merge (still 2 paths), manually merge them
-        if len(tmp_layer.paths) >= 2:
-            print("[Mirror] removeOverlap didn't merge, manually combining paths...")
+        if merged is None:
+            log("Manually combining paths...")
             
             # Reverse the mirrored path using Glyphs API to preserve Bezier structure
             mirrored_half.reverse()
@@ -290,76 +332,83 @@ class MirrorSelectionUI(object):
             # Source: A -> ... -> B
             # Mirror (Reversed): B' -> ... -> A'
             
-            seam_tolerance = 1.0
             merge_tolerance = 1.0
             
-            unified_nodes = []
+            unified_nodes = [n.copy() for n in source_half.nodes]
+            add_node = unified_nodes.append
+            # Axis coordinate of every unified node, kept alongside so the final
+            # bounds check never has to read node positions back
+            unified_coords = [coords[idx] for idx in new_order_indices]
+            add_coord = unified_coords.append
             
-            # Add all source nodes
-            for n in source_half.nodes:
-                unified_nodes.append(n.copy())
+            # Everything the loop below tests is bound to a local up front. The
+            # source half always holds at least two nodes (see the len < 2 guard
+            # above), so its first/last coordinates come straight from the
+            # snapshot and the loop needs no empty-list checks.
+            first_idx = new_order_indices[0]
+            last_idx = new_order_indices[-1]
+            first_x, first_y = xs[first_idx], ys[first_idx]
+            last_x, last_y = xs[last_idx], ys[last_idx]
+            last_i = half_count - 1
+            seam_on_x = axis == 'vertical'
+            tol = merge_tolerance
             
             # Add mirrored nodes (already reversed), skipping duplicates
             for i, n in enumerate(mirrored_half.nodes):
-                node_coord = getattr(n.position, coord_attr)
+                pos = n.position
+                nx, ny = pos.x, pos.y
+                node_coord = nx if seam_on_x else ny
                 is_seam_node = abs(node_coord - seam_coord) <= seam_tolerance
                 
                 # Check for duplicate against last added node (B -> B')
-                if unified_nodes:
-                    last = unified_nodes[-1]
-                    dist_x = abs(n.position.x - last.position.x)
-                    dist_y = abs(n.position.y - last.position.y)
-                    
-                    if dist_x < merge_tolerance and dist_y < merge_tolerance:
-                        print("[Mirror] Skipped duplicate connection node (gap: %.3f, %.3f)" % (dist_x, dist_y))
-                        continue
-                    elif is_seam_node:
-                        # Debug why it wasn't skipped if it was a seam node
-                        print("[Mirror] Seam node NOT skipped! Gap: %.3f, %.3f. Pos: (%.1f, %.1f) vs Last: (%.1f, %.1f)" % 
-                              (dist_x, dist_y, n.position.x, n.position.y, last.position.x, last.position.y))
+                dx = nx - last_x
+                dy = ny - last_y
+                
+                if -tol < dx < tol and -tol < dy < tol:
+                    log("Skipped duplicate connection node (gap: %.3f, %.3f)", abs(dx), abs(dy))
+                    continue
+                elif is_seam_node:
+                    # Debug why it wasn't skipped if it was a seam node
+                    log("Seam node NOT skipped! Gap: %.3f, %.3f. Pos: (%.1f, %.1f) vs Last: (%.1f, %.1f)",
+                        abs(dx), abs(dy), nx, ny, last_x, last_y)
                 
                 # Check for duplicate against first node (A' -> A) - closing the loop
-                if is_seam_node and unified_nodes:
-                    first = unified_nodes[0]
-                    dist_x = abs(n.position.x - first.position.x)
-                    dist_y = abs(n.position.y - first.position.y)
+                if is_seam_node:
+                    dx = nx - first_x
+                    dy = ny - first_y
                     
-                    if dist_x < merge_tolerance and dist_y < merge_tolerance:
-                        print("[Mirror] Skipped duplicate closing node (gap: %.3f, %.3f)" % (dist_x, dist_y))
+                    if -tol < dx < tol and -tol < dy < tol:
+                        log("Skipped duplicate closing node (gap: %.3f, %.3f)", abs(dx), abs(dy))
                         continue
-                    elif i == len(mirrored_half.nodes) - 1:
-                         print("[Mirror] Closing node NOT skipped! Gap: %.3f, %.3f" % (dist_x, dist_y))
+                    elif i == last_i:
+                        log("Closing node NOT skipped! Gap: %.3f, %.3f", abs(dx), abs(dy))
                 
-                unified_nodes.append(n.copy())
+                add_node(n.copy())
+                add_coord(node_coord)
+                last_x, last_y = nx, ny
             
-            # Create the unified path
-            unified = GSPath()
-            for n in unified_nodes:
-                unified.nodes.append(n)
-            unified.closed = True
+            # The merged nodes are fresh, detached copies: no GSPath is needed to
+            # hold them, and they can be written back without copying again.
+            unified_closed = True
             
-            print("[Mirror] Manually merged: %d nodes" % len(unified.nodes))
+            log("Manually merged: %d nodes", len(unified_nodes))
         else:
-            unified = tmp_layer.paths[0]
-            print("[Mirror] removeOverlap merged successfully: %d nodes" % len(unified.nodes))
+            unified_nodes = [n.copy() for n in merged.nodes]
+            unified_coords = [get_coord(n) for n in unified_nodes]
+            unified_closed = merged.closed
+            log("removeOverlap merged successfully: %d nodes", len(unified_nodes))
 
-        if not unified or len(unified.nodes) == 0:
+        if not unified_nodes:
             print("[Mirror] Warning: no nodes in unified path")
             return
 
         # Calculate final bounds and verify size is maintained
-        final_nodes = list(unified.nodes)
-        if final_nodes:
-            if axis == 'vertical':
-                final_min = min(n.position.x for n in final_nodes)
-                final_max = max(n.position.x for n in final_nodes)
-            else:
-                final_min = min(n.position.y for n in final_nodes)
-                final_max = max(n.position.y for n in final_nodes)
+        if unified_coords:
+            final_min = min(unified_coords)
+            final_max = max(unified_coords)
             final_size = final_max - final_min
             
-            print("[Mirror] Final bounds %s: [%.1f, %.1f], size: %.1f" % 
-                  (coord_attr, final_min, final_max, final_size))
+            log("Final bounds %s: [%.1f, %.1f], size: %.1f", coord_attr, final_min, final_max, final_size)
             
             # Check if size is maintained
             if abs(final_size - original_size) > 1.0:
@@ -367,10 +416,10 @@ class MirrorSelectionUI(object):
                       (original_size, final_size))
         
         # Replace nodes of the original path IN PLACE
-        path.nodes = [n.copy() for n in unified.nodes]
-        path.closed = unified.closed
+        path.nodes = unified_nodes
+        path.closed = unified_closed
         
-        print("[Mirror] Final path: %d nodes (expected: %d)" % (len(path.nodes), expected_count))
+        log("Final path: %d nodes (expected: %d)", len(unified_nodes), expected_count)
 
 
 def main():
@@ -8,6 +8,16 @@ from collections import namedtuple
 
 Point = namedtuple("Point", ["x", "y", "on_curve"])
 
+SeamInfo = namedtuple(
+    "SeamInfo",
+    ["seam", "edge", "min_coord", "max_coord", "center_count", "side_count"],
+)
+
+# Whether each source side lies on the low-coordinate side of its axis
+# (in Glyphs, y increases upward, so "top" has larger y values)
+_HORIZONTAL_SOURCE_IS_LOW = {"left": True, "right": False}
+_VERTICAL_SOURCE_IS_LOW = {"bottom": True, "top": False}
+
 
 class MirrorError(Exception):
     """Base exception for mirroring errors."""
@@ -41,7 +51,9 @@ def calculate_axis_from_bounds(points, check_x=True):
     if not points:
         raise MirrorError("Cannot calculate axis from empty point list")
 
-    coords = [p.x if check_x else p.y for p in points]
+    # Point is a tuple, so the axis becomes a column index chosen once
+    col = 0 if check_x else 1
+    coords = [p[col] for p in points]
     min_coord = min(coords)
     max_coord = max(coords)
     return (min_coord + max_coord) / 2.0
@@ -65,14 +77,12 @@ def find_seam_points(points, axis_value, center_band=5.0, check_x=True):
     Returns:
         List of Point objects that are on-curve and within center_band of axis
     """
-    seam_points = []
-    for p in points:
-        if not p.on_curve:
-            continue
-        coord = p.x if check_x else p.y
-        if abs(coord - axis_value) <= center_band:
-            seam_points.append(p)
-    return seam_points
+    # One loop per axis so the x/y choice is made once, not per point
+    if check_x:
+        return [p for p in points
+                if p.on_curve and abs(p.x - axis_value) <= center_band]
+    return [p for p in points
+            if p.on_curve and abs(p.y - axis_value) <= center_band]
 
 
 def validate_seam_alignment(seam_points, check_x=True, eps=0.01):
@@ -93,17 +103,187 @@ def validate_seam_alignment(seam_points, check_x=True, eps=0.01):
     if not seam_points:
         raise NoSeamPointsError("No seam points found")
     
-    coords = [p.x if check_x else p.y for p in seam_points]
-    ref_coord = coords[0]
-    
-    for coord in coords[1:]:
-        if not almost_equal(coord, ref_coord, eps):
+    # Check and sum in one pass, stopping at the first misaligned point
+    col = 0 if check_x else 1
+    ref_coord = seam_points[0][col]
+    total = 0.0
+    for p in seam_points:
+        coord = p[col]
+        # Same test as almost_equal, inlined to save a call per point
+        if abs(coord - ref_coord) > eps:
             raise SeamAlignmentError(
                 f"Seam points not aligned: found {ref_coord} and {coord}"
             )
+        total += coord
     
     # Return the average for precise alignment
-    return sum(coords) / len(coords)
+    return total / len(seam_points)
+
+
+def linearize_selection(selected_indices, node_count):
+    """
+    Order the selected node indices of a closed path as one continuous run.
+    
+    A selection that wraps past the path's start node (e.g. indices 7, 8, 9,
+    0, 1 of 10) is rotated so the first gap in the sequence falls at the end.
+    
+    Args:
+        selected_indices: Ascending indices of the selected nodes
+        node_count: Total number of nodes in the path
+    
+    Returns:
+        List of indices starting right after the first gap; unchanged when the
+        selection has no gap
+    """
+    selected_total = len(selected_indices)
+    for k in range(selected_total):
+        curr_idx = selected_indices[k]
+        next_idx = selected_indices[(k + 1) % selected_total]
+        if (next_idx - curr_idx) % node_count != 1:
+            start = (k + 1) % selected_total
+            return selected_indices[start:] + selected_indices[:start]
+    return list(selected_indices)
+
+
+def classify_selection(
+    coords,
+    off_curve,
+    selected_indices,
+    sign,
+    center_band=5.0,
+    eps=0.01,
+):
+    """
+    Resolve the seam of a path selection from parallel coordinate lists.
+    
+    The seam starts at the selection edge facing the other half. If no
+    selected on-curve point lies within center_band of the path's bounding
+    box center, the center is used as the seam instead.
+    
+    Args:
+        coords: x (vertical seam) or y (horizontal seam) of every path node
+        off_curve: Parallel list of flags, True for off-curve nodes
+        selected_indices: Indices into coords of the selected nodes
+        sign: +1 if the source half lies above the seam, -1 if below
+        center_band: Distance tolerance for reaching the bounds center
+        eps: Minimum distance past the seam for a source-side node
+    
+    Returns:
+        SeamInfo(seam, edge, min_coord, max_coord, center_count, side_count),
+        where side_count is the number of selected nodes on the source side
+    
+    Raises:
+        MirrorError: If the path or the selection is empty
+    """
+    if not coords or not selected_indices:
+        raise MirrorError("Cannot classify an empty selection")
+    
+    # Bounds use the C-level builtins. One pass over the selection then tracks
+    # the edge, center hits and side hits against the bounds center; if the
+    # selection reaches the center, the seam is the edge instead and the side
+    # count is recomputed against it below.
+    min_coord = min(coords)
+    max_coord = max(coords)
+    center = (min_coord + max_coord) / 2.0
+    
+    selected_coords = []
+    add = selected_coords.append
+    edge = coords[selected_indices[0]]
+    center_count = 0
+    center_side_count = 0
+    for i in selected_indices:
+        c = coords[i]
+        add(c)
+        if (c - edge) * sign < 0:
+            edge = c
+        if abs(c - center) <= center_band and not off_curve[i]:
+            center_count += 1
+        if (c - center) * sign > eps:
+            center_side_count += 1
+    
+    if center_count:
+        seam = edge
+        side_count = sum(1 for c in selected_coords if (c - edge) * sign > eps)
+    else:
+        seam = center
+        side_count = center_side_count
+    
+    return SeamInfo(seam, edge, min_coord, max_coord, center_count, side_count)
+
+
+def _aligned_axis(points, axis_value, center_band, eps, check_x, all_path_points):
+    """
+    Resolve the mirror axis from the seam points, falling back to bounds.
+    
+    Runs the public find_seam_points and validate_seam_alignment, so the
+    mirror functions and their callers share one definition of a seam point.
+    The second pass only walks the few seam points found by the first.
+    
+    Raises:
+        NoSeamPointsError: If no seam points are found and all_path_points is None
+        SeamAlignmentError: If seam points are not aligned
+    """
+    seam_points = find_seam_points(points, axis_value, center_band, check_x)
+    if seam_points:
+        # Validate alignment and get precise axis value
+        return validate_seam_alignment(seam_points, check_x=check_x, eps=eps)
+    if all_path_points is None:
+        raise NoSeamPointsError(
+            f"No seam points found near {'x' if check_x else 'y'}={axis_value} "
+            f"within band={center_band}"
+        )
+    return calculate_axis_from_bounds(all_path_points, check_x=check_x)
+
+
+def _mirror_points(
+    points,
+    axis_value,
+    source_is_low,
+    check_x,
+    eps,
+    center_band,
+    all_path_points,
+    deduplicate_seam,
+):
+    """
+    Shared body of mirror_horizontal and mirror_vertical.
+    
+    The reflection is fixed once per call: the mirrored column becomes
+    2*axis - v and the other column is copied, so both directions run the
+    same code with only the column and the source test swapped.
+    """
+    # Find and validate seam points, falling back to bounds
+    aligned = _aligned_axis(
+        points, axis_value, center_band, eps, check_x, all_path_points
+    )
+    
+    # Separate source points (keep as-is)
+    col = 0 if check_x else 1
+    if source_is_low:
+        source = [p for p in points if p[col] <= aligned + eps]
+    else:
+        source = [p for p in points if p[col] >= aligned - eps]
+    
+    # Mirror all source points: v' = axis - (v - axis) = 2*axis - v
+    # Extend the source list in place instead of concatenating into a copy;
+    # the comprehension is fully built before extend() starts appending
+    two_axis = 2 * aligned
+    if deduplicate_seam:
+        # An on-curve point on the axis is shared by both halves, so keep only
+        # the original; handles on the axis belong to a segment in each half
+        to_mirror = [p for p in source
+                     if not (p.on_curve and abs(p[col] - aligned) <= eps)]
+    else:
+        to_mirror = source
+    # Point is a namedtuple, so unpacking beats three attribute lookups and
+    # _make casts a plain tuple without Point.__new__'s argument handling
+    make = Point._make
+    if check_x:
+        source.extend([make((two_axis - x, y, oc)) for x, y, oc in to_mirror])
+    else:
+        source.extend([make((x, two_axis - y, oc)) for x, y, oc in to_mirror])
+    
+    return source
 
 
 def mirror_horizontal(
@@ -113,6 +293,7 @@ def mirror_horizontal(
     eps=0.01,
     center_band=5.0,
     all_path_points=None,
+    deduplicate_seam=False,
 ):
     """
     Mirror points horizontally across a vertical axis.
@@ -124,40 +305,27 @@ def mirror_horizontal(
         eps: Tolerance for coordinate comparisons
         center_band: Distance tolerance for finding seam points
         all_path_points: Optional full path points for bounds-based fallback
+        deduplicate_seam: If True, on-curve points on the axis appear once
+            instead of once in each half
     
     Returns:
         List of Point objects representing the full mirrored shape
     
     Raises:
+        MirrorError: If source_side is not a valid side for this axis
         NoSeamPointsError: If no seam points are found
         SeamAlignmentError: If seam points are not aligned
     """
-    # Find and validate seam points
-    seam_points = find_seam_points(points, axis_x, center_band, check_x=True)
-    if seam_points:
-        # Validate alignment and get precise axis value
-        aligned_x = validate_seam_alignment(seam_points, check_x=True, eps=eps)
-    else:
-        if all_path_points is None:
-            raise NoSeamPointsError(
-                f"No seam points found near x={axis_x} within band={center_band}"
-            )
-        aligned_x = calculate_axis_from_bounds(all_path_points, check_x=True)
-    
-    # Separate source points (keep as-is)
-    if source_side == "left":
-        source = [p for p in points if p.x <= aligned_x + eps]
-    else:  # right
-        source = [p for p in points if p.x >= aligned_x - eps]
-    
-    # Mirror all source points
-    mirrored = []
-    for p in source:
-        # Mirror x coordinate: x' = axis_x - (x - axis_x) = 2*axis_x - x
-        mx = 2 * aligned_x - p.x
-        mirrored.append(Point(mx, p.y, p.on_curve))
-    
-    return source + mirrored
+    try:
+        source_is_low = _HORIZONTAL_SOURCE_IS_LOW[source_side]
+    except KeyError:
+        raise MirrorError(
+            f"Unknown source side for horizontal mirror: {source_side!r}"
+        ) from None
+    return _mirror_points(
+        points, axis_x, source_is_low, True, eps, center_band, all_path_points,
+        deduplicate_seam,
+    )
 
 
 def mirror_vertical(
@@ -167,6 +335,7 @@ def mirror_vertical(
     eps=0.01,
     center_band=5.0,
     all_path_points=None,
+    deduplicate_seam=False,
 ):
     """
     Mirror points vertically across a horizontal axis.
@@ -178,42 +347,24 @@ def mirror_vertical(
         eps: Tolerance for coordinate comparisons
         center_band: Distance tolerance for finding seam points
         all_path_points: Optional full path points for bounds-based fallback
+        deduplicate_seam: If True, on-curve points on the axis appear once
+            instead of once in each half
     
     Returns:
         List of Point objects representing the full mirrored shape
     
     Raises:
+        MirrorError: If source_side is not a valid side for this axis
         NoSeamPointsError: If no seam points are found
         SeamAlignmentError: If seam points are not aligned
     """
-    # Find and validate seam points
-    seam_points = find_seam_points(points, axis_y, center_band, check_x=False)
-    if seam_points:
-        # Validate alignment and get precise axis value
-        aligned_y = validate_seam_alignment(seam_points, check_x=False, eps=eps)
-    else:
-        if all_path_points is None:
-            raise NoSeamPointsError(
-                f"No seam points found near y={axis_y} within band={center_band}"
-            )
-        aligned_y = calculate_axis_from_bounds(all_path_points, check_x=False)
-    
-    # Separate source points (keep as-is)
-    # Note: In Glyphs, y increases upward, so "top" has larger y values
-    if source_side == "top":
-        source = [p for p in points if p.y >= aligned_y - eps]
-    else:  # bottom
-        source = [p for p in points if p.y <= aligned_y + eps]
-    
-    # Mirror all source points
-    mirrored = []
-    for p in source:
-        # Mirror y coordinate: y' = 2*axis_y - y
-        my = 2 * aligned_y - p.y
-        mirrored.append(Point(p.x, my, p.on_curve))
-    
-    return source + mirrored
-
-
-
-
+    try:
+        source_is_low = _VERTICAL_SOURCE_IS_LOW[source_side]
+    except KeyError:
+        raise MirrorError(
+            f"Unknown source side for vertical mirror: {source_side!r}"
+        ) from None
+    return _mirror_points(
+        points, axis_y, source_is_low, False, eps, center_band, all_path_points,
+        deduplicate_seam,
+    )
@@ -16,6 +16,8 @@ from mirror_geometry import (
     SeamAlignmentError,
     NoSeamPointsError,
     calculate_axis_from_bounds,
+    linearize_selection,
+    classify_selection,
 )
 
 
@@ -25,14 +27,21 @@ def assert_points_close(actual, expected, tol=0.01):
         f"Point count mismatch: {len(actual)} vs {len(expected)}"
     
     for i, (a, e) in enumerate(zip(actual, expected)):
-        assert almost_equal(a.x, e.x, tol), \
-            f"Point {i} x mismatch: {a.x} vs {e.x}"
-        assert almost_equal(a.y, e.y, tol), \
-            f"Point {i} y mismatch: {a.y} vs {e.y}"
+        assert (a.x, a.y) == pytest.approx((e.x, e.y), rel=0, abs=tol), \
+            f"Point {i} mismatch: ({a.x}, {a.y}) vs ({e.x}, {e.y})"
         assert a.on_curve == e.on_curve, \
             f"Point {i} on_curve mismatch: {a.on_curve} vs {e.on_curve}"
 
 
+def contains_point(points, x, y, on_curve=None, tol=0.01):
+    """Check whether a point at (x, y), optionally of the given kind, is present."""
+    for p in points:
+        if almost_equal(p.x, x, tol) and almost_equal(p.y, y, tol):
+            if on_curve is None or p.on_curve == on_curve:
+                return True
+    return False
+
+
 class TestAlmostEqual:
     def test_equal_values(self):
         assert almost_equal(1.0, 1.0)
@@ -72,6 +81,12 @@ class TestFindSeamPoints:
         points = [Point(10.0, 10.0, True), Point(20.0, 20.0, True)]
         seam = find_seam_points(points, axis_value=0.0, center_band=1.0, check_x=True)
         assert len(seam) == 0
+    
+    def test_band_edge_uses_distance(self):
+        # 0.4 - 0.3 is slightly above 0.1 in floating point, so the point is
+        # outside the band even though 0.3 + 0.1 >= 0.4
+        seam = find_seam_points([Point(0.4, 0.0, True)], 0.3, 0.1, check_x=True)
+        assert seam == []
 
 
 class TestValidateSeamAlignment:
@@ -101,6 +116,14 @@ class TestValidateSeamAlignment:
         with pytest.raises(SeamAlignmentError):
             validate_seam_alignment(points, check_x=True, eps=0.01)
     
+    def test_single_seam_point(self):
+        seam = [Point(42, 7, True)]
+        x = validate_seam_alignment(seam, check_x=True)
+        y = validate_seam_alignment(seam, check_x=False)
+        # Always the float average, even for int coordinates
+        assert x == 42.0 and isinstance(x, float)
+        assert y == 7.0 and isinstance(y, float)
+    
     def test_empty_seam_raises_error(self):
         with pytest.raises(NoSeamPointsError):
             validate_seam_alignment([], check_x=True)
@@ -129,38 +152,97 @@ class TestCalculateAxisFromBounds:
             calculate_axis_from_bounds([], check_x=True)
 
 
+class TestLinearizeSelection:
+    def test_contiguous_selection_unchanged(self):
+        assert linearize_selection([2, 3, 4], 10) == [2, 3, 4]
+
+    def test_wrapping_selection_rotated(self):
+        assert linearize_selection([0, 1, 2, 7, 8, 9], 10) == [7, 8, 9, 0, 1, 2]
+
+    def test_full_selection_unchanged(self):
+        assert linearize_selection([0, 1, 2, 3], 4) == [0, 1, 2, 3]
+
+    def test_multiple_gaps_use_first(self):
+        assert linearize_selection([1, 2, 5, 6], 10) == [5, 6, 1, 2]
+
+
+class TestClassifySelection:
+    def test_selection_reaching_center_uses_edge(self):
+        # Left half of a diamond: nodes at x = 0, 50 (seam), 100
+        coords = [0.0, 50.0, 100.0, 50.0]
+        off_curve = [False, False, False, False]
+        info = classify_selection(coords, off_curve, [0, 1, 3], sign=-1)
+        assert almost_equal(info.seam, 50.0)
+        assert info.edge == 50.0
+        assert info.center_count == 2
+        assert info.side_count == 1
+
+    def test_selection_short_of_center_uses_bounds_center(self):
+        coords = [0.0, 20.0, 180.0, 200.0]
+        off_curve = [False, False, False, False]
+        info = classify_selection(coords, off_curve, [0, 1], sign=-1)
+        assert info.center_count == 0
+        assert almost_equal(info.seam, 100.0)
+        assert info.edge == 20.0
+        assert info.side_count == 2
+
+    def test_off_curve_does_not_reach_center(self):
+        coords = [0.0, 100.0, 200.0]
+        off_curve = [False, True, False]
+        info = classify_selection(coords, off_curve, [0, 1], sign=-1)
+        assert info.center_count == 0
+        assert almost_equal(info.seam, 100.0)
+
+    def test_only_seam_nodes_selected(self):
+        coords = [100.0, 100.0, 200.0, 0.0]
+        off_curve = [False, False, False, False]
+        info = classify_selection(coords, off_curve, [0, 1], sign=1)
+        assert info.side_count == 0
+
+    def test_positive_sign_uses_min_edge(self):
+        # Top half selected: seam is the lowest selected y
+        coords = [100.0, 150.0, 100.0, 50.0]
+        off_curve = [False, False, False, False]
+        info = classify_selection(coords, off_curve, [0, 1, 2], sign=1)
+        assert info.edge == 100.0
+        assert info.side_count == 1
+
+    def test_empty_selection_raises_error(self):
+        with pytest.raises(MirrorError):
+            classify_selection([0.0, 1.0], [False, False], [], sign=-1)
+
+
 class TestMirrorHorizontal:
-    def test_simple_triangle_left_source(self):
-        """Mirror a simple left-side triangle to the right."""
-        points = [
-            Point(-10.0, 0.0, True),   # left bottom
-            Point(0.0, 10.0, True),    # seam top
-            Point(0.0, 0.0, True),     # seam bottom
-        ]
-        
-        result = mirror_horizontal(points, axis_x=0.0, source_side="left", center_band=1.0)
-        
-        # Should have original + mirrored
-        assert len(result) == 6
-        
-        # Check the mirrored left bottom point
-        assert any(almost_equal(p.x, 10.0) and almost_equal(p.y, 0.0) for p in result)
-    
-    def test_simple_triangle_right_source(self):
-        """Mirror a simple right-side triangle to the left."""
-        points = [
-            Point(0.0, 0.0, True),     # seam bottom
-            Point(0.0, 10.0, True),    # seam top
-            Point(10.0, 0.0, True),    # right bottom
-        ]
-        
-        result = mirror_horizontal(points, axis_x=0.0, source_side="right", center_band=1.0)
+    @pytest.mark.parametrize(
+        "points, axis_x, source_side, center_band, expected",
+        [
+            # Simple left-side triangle mirrored to the right
+            (
+                [Point(-10.0, 0.0, True), Point(0.0, 10.0, True), Point(0.0, 0.0, True)],
+                0.0, "left", 1.0, (10.0, 0.0),
+            ),
+            # Simple right-side triangle mirrored to the left
+            (
+                [Point(0.0, 0.0, True), Point(0.0, 10.0, True), Point(10.0, 0.0, True)],
+                0.0, "right", 1.0, (-10.0, 0.0),
+            ),
+            # Axis that's not at x=0: 90 mirrors to 110
+            (
+                [Point(90.0, 0.0, True), Point(100.0, 10.0, True), Point(100.0, 0.0, True)],
+                100.0, "left", 5.0, (110.0, 0.0),
+            ),
+        ],
+        ids=["triangle_left_source", "triangle_right_source", "non_zero_axis"],
+    )
+    def test_simple_mirror(self, points, axis_x, source_side, center_band, expected):
+        """Mirror a simple shape and find the reflected outer point."""
+        result = mirror_horizontal(
+            points, axis_x=axis_x, source_side=source_side, center_band=center_band
+        )
         
         # Should have original + mirrored
         assert len(result) == 6
-        
-        # Check the mirrored right bottom point
-        assert any(almost_equal(p.x, -10.0) and almost_equal(p.y, 0.0) for p in result)
+        assert contains_point(result, *expected)
     
     def test_with_off_curve_handles(self):
         """Ensure off-curve points (handles) are mirrored correctly."""
@@ -178,19 +260,6 @@ class TestMirrorHorizontal:
         assert len(mirrored_handle) == 1
         assert mirrored_handle[0].on_curve == False
     
-    def test_non_zero_axis(self):
-        """Mirror around an axis that's not at x=0."""
-        points = [
-            Point(90.0, 0.0, True),    # left of axis
-            Point(100.0, 10.0, True),  # seam
-            Point(100.0, 0.0, True),   # seam
-        ]
-        
-        result = mirror_horizontal(points, axis_x=100.0, source_side="left")
-        
-        # Original point at 90 should mirror to 110
-        assert any(almost_equal(p.x, 110.0) and almost_equal(p.y, 0.0) for p in result)
-    
     def test_misaligned_seam_raises_error(self):
         """Should raise error when seam points are not aligned."""
         points = [
@@ -212,6 +281,15 @@ class TestMirrorHorizontal:
         with pytest.raises(NoSeamPointsError):
             mirror_horizontal(points, axis_x=0.0, source_side="left", center_band=1.0)
 
+    def test_unknown_source_side_raises_error(self):
+        """A vertical-mirror side is rejected before any work is done."""
+        points = [Point(-10.0, 0.0, True), Point(0.0, 0.0, True)]
+        
+        with pytest.raises(MirrorError) as excinfo:
+            mirror_horizontal(points, axis_x=0.0, source_side="top")
+        # The internal lookup failure is not chained onto the error
+        assert excinfo.value.__suppress_context__
+
     def test_bounds_fallback_no_seam_horizontal(self):
         """Mirror using bounds when no seam nodes are selected."""
         selected = [
@@ -232,8 +310,8 @@ class TestMirrorHorizontal:
 
         # Expect two mirrored points on the right half
         assert len(result) == 4
-        assert any(almost_equal(p.x, 190.0) and almost_equal(p.y, 0.0) for p in result)
-        assert any(almost_equal(p.x, 180.0) and almost_equal(p.y, 40.0) for p in result)
+        assert contains_point(result, 190.0, 0.0)
+        assert contains_point(result, 180.0, 40.0)
 
     def test_seam_points_take_precedence_over_bounds(self):
         """When seam nodes exist, ignore bounds-only axis."""
@@ -254,40 +332,37 @@ class TestMirrorHorizontal:
         )
 
         # Seam-based axis (x=0) should be used, so left point mirrors to x=10
-        assert any(almost_equal(p.x, 10.0) and almost_equal(p.y, 0.0) for p in result)
+        assert contains_point(result, 10.0, 0.0)
 
 class TestMirrorVertical:
-    def test_simple_trapezoid_top_source(self):
-        """Mirror a top trapezoid downward."""
-        points = [
-            Point(0.0, 100.0, True),   # seam left
-            Point(10.0, 100.0, True),  # seam right
-            Point(5.0, 110.0, True),   # top middle
-        ]
-        
-        result = mirror_vertical(points, axis_y=100.0, source_side="top")
+    @pytest.mark.parametrize(
+        "points, axis_y, source_side, expected",
+        [
+            # Top trapezoid mirrored downward: y=110 -> y=90
+            (
+                [Point(0.0, 100.0, True), Point(10.0, 100.0, True), Point(5.0, 110.0, True)],
+                100.0, "top", (5.0, 90.0),
+            ),
+            # Bottom trapezoid mirrored upward: y=90 -> y=110
+            (
+                [Point(5.0, 90.0, True), Point(0.0, 100.0, True), Point(10.0, 100.0, True)],
+                100.0, "bottom", (5.0, 110.0),
+            ),
+            # Non-zero y axis: y=510 -> y=490
+            (
+                [Point(0.0, 500.0, True), Point(10.0, 500.0, True), Point(5.0, 510.0, True)],
+                500.0, "top", (5.0, 490.0),
+            ),
+        ],
+        ids=["trapezoid_top_source", "trapezoid_bottom_source", "non_zero_axis"],
+    )
+    def test_simple_mirror(self, points, axis_y, source_side, expected):
+        """Mirror a simple shape and find the reflected outer point."""
+        result = mirror_vertical(points, axis_y=axis_y, source_side=source_side)
         
         # Should have original + mirrored
         assert len(result) == 6
-        
-        # Top middle at y=110 should mirror to y=90
-        assert any(almost_equal(p.x, 5.0) and almost_equal(p.y, 90.0) for p in result)
-    
-    def test_simple_trapezoid_bottom_source(self):
-        """Mirror a bottom trapezoid upward."""
-        points = [
-            Point(5.0, 90.0, True),    # bottom middle
-            Point(0.0, 100.0, True),   # seam left
-            Point(10.0, 100.0, True),  # seam right
-        ]
-        
-        result = mirror_vertical(points, axis_y=100.0, source_side="bottom")
-        
-        # Should have original + mirrored
-        assert len(result) == 6
-        
-        # Bottom middle at y=90 should mirror to y=110
-        assert any(almost_equal(p.x, 5.0) and almost_equal(p.y, 110.0) for p in result)
+        assert contains_point(result, *expected)
     
     def test_with_handles_vertical(self):
         """Ensure off-curve points are handled correctly in vertical mirror."""
@@ -304,19 +379,6 @@ class TestMirrorVertical:
         assert len(mirrored_handle) == 1
         assert mirrored_handle[0].on_curve == False
     
-    def test_non_zero_axis_vertical(self):
-        """Mirror around a non-zero y axis."""
-        points = [
-            Point(0.0, 500.0, True),   # seam
-            Point(10.0, 500.0, True),  # seam
-            Point(5.0, 510.0, True),   # above seam
-        ]
-        
-        result = mirror_vertical(points, axis_y=500.0, source_side="top")
-        
-        # Point at y=510 should mirror to y=490
-        assert any(almost_equal(p.y, 490.0) for p in result)
-    
     def test_misaligned_vertical_seam_raises_error(self):
         """Should raise error when vertical seam is not aligned."""
         points = [
@@ -328,6 +390,13 @@ class TestMirrorVertical:
         with pytest.raises(SeamAlignmentError):
             mirror_vertical(points, axis_y=100.0, source_side="top")
 
+    def test_unknown_source_side_raises_error(self):
+        """A horizontal-mirror side is rejected before any work is done."""
+        points = [Point(0.0, 100.0, True), Point(5.0, 110.0, True)]
+        
+        with pytest.raises(MirrorError):
+            mirror_vertical(points, axis_y=100.0, source_side="left")
+    
     def test_bounds_fallback_no_seam_vertical(self):
         """Mirror vertically using bounds fallback."""
         selected = [
@@ -365,6 +434,57 @@ class TestToleranceBoundaries:
         seam_points = [p for p in result if almost_equal(p.x, 0.0)]
         assert len(seam_points) >= 2
     
+    def test_deduplicate_seam_keeps_one_copy(self):
+        """With deduplicate_seam, seam points are not mirrored onto themselves."""
+        points = [
+            Point(-10.0, 0.0, True),
+            Point(0.0, 5.0, True),
+            Point(0.0, 10.0, True),
+        ]
+        
+        result = mirror_horizontal(
+            points, axis_x=0.0, source_side="left", deduplicate_seam=True
+        )
+        
+        assert len(result) == 4
+        seam_points = [p for p in result if almost_equal(p.x, 0.0)]
+        assert len(seam_points) == 2
+        assert contains_point(result, 10.0, 0.0)
+    
+    def test_deduplicate_seam_vertical(self):
+        points = [
+            Point(0.0, 100.0, True),   # seam
+            Point(5.0, 105.0, False),  # handle above seam
+            Point(10.0, 100.0, True),  # seam
+        ]
+        
+        result = mirror_vertical(
+            points, axis_y=100.0, source_side="top", deduplicate_seam=True
+        )
+        
+        assert len(result) == 4
+        assert contains_point(result, 5.0, 95.0, on_curve=False)
+    
+    def test_deduplicate_seam_keeps_handles_on_axis(self):
+        """Off-curve points on the axis still get mirrored into the other half."""
+        points = [
+            Point(-50.0, 0.0, True),
+            Point(-50.0, 50.0, False),
+            Point(0.0, 80.0, False),   # handle on the axis
+            Point(0.0, 100.0, True),   # seam
+        ]
+        
+        result = mirror_horizontal(
+            points, axis_x=0.0, source_side="left", deduplicate_seam=True
+        )
+        
+        assert len(result) == 7
+        handles_on_axis = [p for p in result
+                           if almost_equal(p.x, 0.0) and not p.on_curve]
+        assert len(handles_on_axis) == 2
+        seam_points = [p for p in result if almost_equal(p.x, 0.0) and p.on_curve]
+        assert len(seam_points) == 1
+    
     def test_center_band_edge_case(self):
         """Points near the seam within center_band."""
         points = [
@@ -378,7 +498,7 @@ class TestToleranceBoundaries:
         # Should not raise an error
         assert len(result) > 0
         # Far point should be mirrored
-        assert any(almost_equal(p.x, 10.0) and almost_equal(p.y, 0.0) for p in result)
+        assert contains_point(result, 10.0, 0.0)
 
 
 class TestNodeCountValidation:
@@ -446,7 +566,7 @@ class TestNodeCountValidation:
         
         # Verify mirrored positions (axis = 55, so x' = 110 - x)
         # Original (10, 0) -> mirrored (100, 0)
-        assert any(almost_equal(p.x, 100.0) and almost_equal(p.y, 0.0) for p in result)
+        assert contains_point(result, 100.0, 0.0)
 
 
 class TestRoundedRectangleCase:
@@ -504,41 +624,41 @@ class TestRoundedRectangleCase:
         # Check mirrored points exist (x' = 1372 - x)
         
         # Original (202, 0) -> mirrored (1170, 0)
-        assert any(almost_equal(p.x, 1170.0) and almost_equal(p.y, 0.0) and p.on_curve for p in result), \
+        assert contains_point(result, 1170.0, 0.0, on_curve=True), \
             "Missing mirrored point (1170, 0)"
         
         # Original handle (71, 0) -> mirrored (1301, 0)
-        assert any(almost_equal(p.x, 1301.0) and almost_equal(p.y, 0.0) and not p.on_curve for p in result), \
+        assert contains_point(result, 1301.0, 0.0, on_curve=False), \
             "Missing mirrored handle (1301, 0)"
         
         # Original handle (0, 70) -> mirrored (1372, 70)
-        assert any(almost_equal(p.x, 1372.0) and almost_equal(p.y, 70.0) and not p.on_curve for p in result), \
+        assert contains_point(result, 1372.0, 70.0, on_curve=False), \
             "Missing mirrored handle (1372, 70)"
         
         # Original (0, 202) -> mirrored (1372, 202)
-        assert any(almost_equal(p.x, 1372.0) and almost_equal(p.y, 202.0) and p.on_curve for p in result), \
+        assert contains_point(result, 1372.0, 202.0, on_curve=True), \
             "Missing mirrored point (1372, 202)"
         
         # Original (0, 1170) -> mirrored (1372, 1170)
-        assert any(almost_equal(p.x, 1372.0) and almost_equal(p.y, 1170.0) and p.on_curve for p in result), \
+        assert contains_point(result, 1372.0, 1170.0, on_curve=True), \
             "Missing mirrored point (1372, 1170)"
         
         # Original handle (0, 1301) -> mirrored (1372, 1301)
-        assert any(almost_equal(p.x, 1372.0) and almost_equal(p.y, 1301.0) and not p.on_curve for p in result), \
+        assert contains_point(result, 1372.0, 1301.0, on_curve=False), \
             "Missing mirrored handle (1372, 1301)"
         
         # Original handle (71, 1372) -> mirrored (1301, 1372)
-        assert any(almost_equal(p.x, 1301.0) and almost_equal(p.y, 1372.0) and not p.on_curve for p in result), \
+        assert contains_point(result, 1301.0, 1372.0, on_curve=False), \
             "Missing mirrored handle (1301, 1372)"
         
         # Original (202, 1372) -> mirrored (1170, 1372)
-        assert any(almost_equal(p.x, 1170.0) and almost_equal(p.y, 1372.0) and p.on_curve for p in result), \
+        assert contains_point(result, 1170.0, 1372.0, on_curve=True), \
             "Missing mirrored point (1170, 1372)"
         
         # Also verify original points are preserved
-        assert any(almost_equal(p.x, 202.0) and almost_equal(p.y, 0.0) for p in result), \
+        assert contains_point(result, 202.0, 0.0), \
             "Original point (202, 0) should be preserved"
-        assert any(almost_equal(p.x, 71.0) and almost_equal(p.y, 0.0) for p in result), \
+        assert contains_point(result, 71.0, 0.0), \
             "Original handle (71, 0) should be preserved"
 
 